@@ -0,0 +1,82 @@
+# Measures the throughput and CPU cost of multiple external threads
+# concurrently calling tell() on the same ActorSystem, which exercises
+# the hand-off of transmit processing between the submitting threads
+# and the transport.
+#
+# Run this from the top level as:
+#    $ python examples/tellcontention.py [<number-of-threads>] [<messages-per-thread>] [<system-base>]
+
+
+import threading
+import time
+from logsetup import logcfg
+from thespian.actors import *
+
+
+class Count(object):
+    def __init__(self, expected):
+        self.expected = expected
+
+
+class Counter(Actor):
+    def __init__(self, *args, **kw):
+        super(Counter, self).__init__(*args, **kw)
+        self.count = 0
+        self.waiting = None
+
+    def receiveMessage(self, message, sender):
+        if isinstance(message, Count):
+            self.waiting = (sender, message.expected)
+        elif isinstance(message, int):
+            self.count += 1
+        else:
+            return
+        if self.waiting and self.count >= self.waiting[1]:
+            self.send(self.waiting[0], self.count)
+            self.waiting = None
+
+
+def teller(asys, counter, num_messages):
+    for each in range(num_messages):
+        asys.tell(counter, each)
+
+
+def run_example(num_threads, num_messages, system_base):
+    try:
+        num_threads = int(num_threads)
+        num_messages = int(num_messages)
+    except ValueError:
+        print('usage: tellcontention.py [<num-threads>] [<messages-per-thread>] [<system-base>]')
+        sys.exit(1)
+    asys = ActorSystem(system_base, logDefs=logcfg)
+    try:
+        print(f'tellcontention on {system_base} with {num_threads} thread(s)'
+              f' each sending {num_messages} message(s)')
+        counter = asys.createActor(Counter)
+        threads = [threading.Thread(target=teller,
+                                    args=(asys, counter, num_messages))
+                   for _ in range(num_threads)]
+        start = time.perf_counter()
+        start_cpu = time.process_time()
+        for each in threads:
+            each.start()
+        for each in threads:
+            each.join()
+        end_tell = time.perf_counter()
+        total = asys.ask(counter, Count(num_threads * num_messages), 60)
+        end = time.perf_counter()
+        end_cpu = time.process_time()
+        print(f'tell() calls completed in {end_tell - start:.3f} seconds')
+        print(f'{total} messages received in {end - start:.3f} seconds'
+              f' ({(total or 0) / (end - start):.1f} msgs/sec)')
+        print(f'{end_cpu - start_cpu:.3f} seconds of CPU used by the sending process')
+    finally:
+        asys.shutdown()
+
+if __name__ == "__main__":
+    import sys
+    run_example(
+        sys.argv[1] if len(sys.argv) > 1 else "8",
+        sys.argv[2] if len(sys.argv) > 2 else "500",
+        sys.argv[3] if len(sys.argv) > 3 else "multiprocTCPBase",
+    )
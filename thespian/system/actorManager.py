@@ -39,6 +39,7 @@ class ActorManager(systemCommonBase):
         self.capabilities = currentSystemCapabilities
         self._actorClass = childClass  # nb. this may be a string, and sourceHash is not loaded yet
         self._childReqs  = childRequirements
+        self._configure_throttle(self.capabilities, self._childReqs)
         self.actorInst   = None
         self.globalName  = globalName
         self._srcNotifyEnabled = False
@@ -264,6 +265,7 @@ class ActorManager(systemCommonBase):
                 self._send_intent(TransmitIntent(self.myAddress,
                                                  ActorExitRequest()))
             self.capabilities = envelope.message.newCapabilities
+            self._configure_throttle(self.capabilities, self._childReqs)
         for child in self.childAddresses:
             self._send_intent(TransmitIntent(child, envelope.message))
         return True
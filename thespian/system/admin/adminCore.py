@@ -46,6 +46,7 @@ class AdminCore(systemCommonBase):
         super(AdminCore, self).__init__(address, transport)
         self.init_replicator(transport, concurrency_context)
         self.capabilities = capabilities
+        self._configure_throttle(self.capabilities)
         self.logdefs = logdefs
         self._pendingChildren = {}  # Use: childLocalAddr instance # : [PendingActorEnvelope]
         # Things that help us look like an Actor, even though we're not
@@ -633,6 +634,7 @@ class AdminCore(systemCommonBase):
         return updateLocals
 
     def _capUpdateLocalActors(self):
+        self._configure_throttle(self.capabilities)
         newCaps = NewCapabilities(self.capabilities, self.myAddress)
         for each in self.childAddresses:
             self._send_intent(TransmitIntent(each, newCaps))
@@ -1,6 +1,6 @@
 from datetime import timedelta
 from time import sleep as delay
-from thespian.system.timing import timePeriodSeconds, Timer
+from thespian.system.timing import timePeriodSeconds, Timer, currentTime
 
 class RateThrottle(object):
     """This object is used to provide rate throttling for activities.  It
@@ -65,3 +65,114 @@ class RateThrottle(object):
             delattr(self, '_curRate')
             self._runningCount = 0
             return
+
+
+# The observed link rate is sampled over periods of this many seconds.
+LINK_SAMPLE_PERIOD = 1.0
+
+# Allowance for floating point accumulation errors when refilling.
+TOKEN_EPSILON_ONE = 1 - 1e-9
+
+# Weight given to each new sample in the running link rate and message
+# size averages.
+LINK_SAMPLE_WEIGHT = 0.3
+
+
+class TokenBucketThrottle(object):
+    """Non-blocking rate throttling using a token bucket.  Instead of
+       pausing, eventDelay() indicates how long the caller should
+       defer the event.
+
+       The maximum rate (in # events/sec) may be specified explicitly
+       (a value of 0 disables throttling).  If it is not specified,
+       the rate is derived from the observed link rate: the
+       observeTransmit() method should be called for each completed
+       transmit to report the size of the transmit and whether
+       transmits were backing up at the time (indicating that the
+       link was saturated).  The link rate is estimated from the
+       bytes/sec measured while saturated, and the event rate is
+       limited to linkUtilization percent of that link rate at the
+       observed average transmit size.  No throttling is performed
+       until the link has been observed to be saturated.
+
+       The burst is the number of events that can occur without delay
+       after a quiet period, defaulting to one second's worth of
+       events at the maximum rate.
+    """
+
+    def __init__(self, maximumRate=None, burst=None, linkUtilization=70):
+        self._fixedRate = maximumRate
+        self._burst = burst
+        self._utilization = linkUtilization / 100.0
+        self._tokens = None
+        self._lastFill = None
+        self._linkRate = None  # bytes/sec when saturated
+        self._avgSize = None   # bytes/event
+        self._sampleStart = None
+        self._sampleBytes = 0
+        self._sampleEvents = 0
+        self._sampleSaturated = False
+
+    @property
+    def maximumRate(self):
+        "The current maximum number of events/sec, or None if unlimited."
+        if self._fixedRate is not None:
+            return self._fixedRate or None
+        if not self._linkRate or not self._avgSize:
+            return None
+        return max(1.0, self._linkRate * self._utilization / self._avgSize)
+
+    def __str__(self):
+        rate = self.maximumRate
+        return 'Token bucket: %s messages/sec (%s, link %s bytes/sec, %s tokens)' % (
+            'unlimited' if rate is None else '%.1f' % rate,
+            'fixed' if self._fixedRate is not None else 'observed',
+            'unknown' if self._linkRate is None else '%.0f' % self._linkRate,
+            'full' if self._tokens is None else '%.1f' % self._tokens)
+
+    def eventDelay(self, curtime=None):
+        """This is the main method that should be called each time an event
+           is to occur.  Returns 0 if the event can occur now (and
+           accounts for that event), otherwise returns the number of
+           seconds to wait before trying again.
+        """
+        rate = self.maximumRate
+        if not rate:
+            self._tokens = None
+            return 0
+        curtime = curtime or currentTime()
+        burst = self._burst or rate
+        if self._tokens is None:
+            tokens = burst
+        else:
+            tokens = min(burst, self._tokens + (curtime - self._lastFill) * rate)
+        self._lastFill = curtime
+        if tokens >= TOKEN_EPSILON_ONE:
+            self._tokens = max(0, tokens - 1)
+            return 0
+        self._tokens = tokens
+        return (1 - tokens) / rate
+
+    def observeTransmit(self, numBytes, saturated, curtime=None):
+        """Called to report a completed transmit of numBytes; saturated is
+           True if other transmits were waiting at the time.
+        """
+        curtime = curtime or currentTime()
+        if self._sampleStart is None:
+            self._sampleStart = curtime
+        self._sampleBytes += numBytes
+        self._sampleEvents += 1
+        self._sampleSaturated = self._sampleSaturated or saturated
+        elapsed = curtime - self._sampleStart
+        if elapsed < LINK_SAMPLE_PERIOD:
+            return
+        avg = lambda old, new: new if old is None else \
+              (old + (new - old) * LINK_SAMPLE_WEIGHT)
+        self._avgSize = avg(self._avgSize,
+                            self._sampleBytes / float(self._sampleEvents))
+        if self._sampleSaturated:
+            self._linkRate = avg(self._linkRate, self._sampleBytes / elapsed)
+        self._sampleStart = curtime
+        self._sampleBytes = 0
+        self._sampleEvents = 0
+        self._sampleSaturated = False
@@ -4,7 +4,7 @@ import logging
 from thespian.actors import *
 from thespian.system.utilis import thesplog, StatsManager, AssocList
 from thespian.system.timing import ExpirationTimer, unexpired
-from thespian.system.ratelimit import RateThrottle
+from thespian.system.ratelimit import TokenBucketThrottle
 from thespian.system.addressManager import (ActorAddressManager,
                                             CannotPickleAddress,
                                             ActorLocalAddress)
@@ -12,19 +12,19 @@ from thespian.system.messages.logcontrol import SetLogging
 from thespian.system.transport import *
 from thespian.system.utilis import fmap
 from itertools import chain
-from datetime import datetime
+from collections import deque
 import traceback
 
 
 MAX_SHUTDOWN_DRAIN_PERIOD=timedelta(seconds=7)
 
-# Assume a 2 KiB average packet size and a 100 Mb/s (12.5 MiB/s)
-# network link, the link could be saturated by transmitting N
-# packets/second (link_capacity / pktsize).  Current target is 70%
-# saturation (arbitrarily).
+# The maximum rate (messages/second) for sends from an Actor can be
+# set via this key in the Actor's targetActorRequirements or else in
+# the ActorSystem capabilities.  A value of 0 disables throttling.
+# If not specified, the rate is limited to 70% (arbitrarily) of the
+# link rate observed when transmits are backing up.
 
-RATE_THROTTLE = (lambda sizeAvg, linkSpeed, percentage:
-                 int((linkSpeed / sizeAvg) * (percentage / 100.0)))(2048, 12.5*1024*1024, 70)
+RATE_THROTTLE_CAPABILITY = 'Thespian Rate Throttle'
 
 
 class AddressWaitTransmits(object):
@@ -72,7 +72,10 @@ class systemCommonBase(object):
         self._awaitingAddressUpdate = AddressWaitTransmits()
         self._receiveQueue = []  # array of ReceiveMessage to be processed
         self._children = []  # array of Addresses of children of this Actor/Admin
-        self._governer = RateThrottle(RATE_THROTTLE)
+        self._throttleRate = None
+        self._governer = TokenBucketThrottle()
+        self._throttledSends = deque()
+        self._throttleReleasePending = False
         self._sCBStats = StatsManager()
 
 
@@ -113,6 +116,8 @@ class systemCommonBase(object):
             resp.addReceivedMessage(each.sender, self.myAddress, each.message)
         self._sCBStats.copyToStatusResponse(resp)
         resp.governer = str(self._governer)
+        for each in self._throttledSends:
+            resp.addPendingMessage(self.myAddress, each.targetAddr, each.message)
         fmap(lambda x: resp.addTXPendingAddressCount(*len_second(x)),
              self._awaitingAddressUpdate)
         self.transport._updateStatusResponse(resp)
@@ -128,15 +133,75 @@ class systemCommonBase(object):
     # ----------------------------------------------------------------------
     # Transmit management
 
+    def _configure_throttle(self, capabilities, requirements=None):
+        """Sets the maximum outbound message rate from the
+           RATE_THROTTLE_CAPABILITY in the requirements or the
+           capabilities (in that order of precedence).
+        """
+        rate = (requirements or {}).get(RATE_THROTTLE_CAPABILITY,
+                                        (capabilities or {}).get(RATE_THROTTLE_CAPABILITY))
+        if rate is not None:
+            try:
+                rate = float(rate)
+            except (TypeError, ValueError):
+                thesplog('Invalid %s value: %s; using observed link rate',
+                         RATE_THROTTLE_CAPABILITY, rate, level=logging.WARNING)
+                rate = None
+        if rate != self._throttleRate:
+            self._throttleRate = rate
+            self._governer = TokenBucketThrottle(rate)
+
+
     def _send_intent(self, intent, curtime=None):
-        self._governer.eventRatePause(curtime or datetime.now())
-        # Check if there are any existing transmits in progress to
-        # this address (on either the input address or the validated
-        # address); if so, just add the new one to the list and
-        # return.
+        if not isinstance(intent.message, Thespian__UpdateWork):
+            intent.addCallback(self._observe_transmit)
+        self._throttled_send(intent, curtime)
+
+
+    def _throttled_send(self, intent, curtime=None):
+        # Sends that exceed the rate limit are deferred (in order)
+        # rather than blocking the Actor.
+        if self._throttledSends or \
+           (not isinstance(intent.message, Thespian__UpdateWork) and
+            self._governer.eventDelay(curtime)):
+            self._throttledSends.append(intent)
+            self._schedule_throttle_release()
+            return
         self._send_intent_to_transport(intent)
 
 
+    def _observe_transmit(self, result, intent):
+        if isinstance(intent.serMsg, bytes):
+            self._governer.observeTransmit(len(intent.serMsg),
+                                           self.transport.transmitsBacklogged())
+
+
+    def _schedule_throttle_release(self):
+        if self._throttleReleasePending:
+            return
+        delay = self._governer.eventDelay()
+        if not delay:
+            self._release_throttled_sends(delay)
+            return
+        self._throttleReleasePending = True
+        self.transport.addTimerCallback(timedelta(seconds=delay),
+                                        self._release_throttled_sends)
+
+
+    def _release_throttled_sends(self, delay=None):
+        # n.b. if delay is 0, a token has already been consumed for
+        # the first deferred send.
+        self._throttleReleasePending = False
+        if delay is None:
+            delay = self._governer.eventDelay()
+        while self._throttledSends and not delay:
+            self._send_intent_to_transport(self._throttledSends.popleft())
+            if self._throttledSends:
+                delay = self._governer.eventDelay()
+        if self._throttledSends:
+            self._schedule_throttle_release()
+
+
     def _retryPendingChildOperations(self, childInstance, actualAddress):
         # actualAddress will be None if the child could not be created
         lcladdr = self._addrManager.getLocalAddress(childInstance)
@@ -149,7 +214,7 @@ class systemCommonBase(object):
                         .remove_intents_for_address(lcladdr):
             if actualAddress:
                 self._sCBStats.inc('Actor.Message Send.Transmit ReInitiated')
-                self._send_intent(each)
+                self._throttled_send(each)
             else:
                 if not isinstance(each.message, PoisonMessage):
                     self._receiveQueue.append(
@@ -197,6 +262,9 @@ class systemCommonBase(object):
 
 
     def drainTransmits(self):
+        # Throttling no longer applies when draining for shutdown.
+        while self._throttledSends:
+            self._send_intent_to_transport(self._throttledSends.popleft())
         drainLimit = ExpirationTimer(MAX_SHUTDOWN_DRAIN_PERIOD)
         for drain_remaining_time in unexpired(drainLimit):
             if not self.transport.run(TransmitOnly, drain_remaining_time.remaining()):
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from time import sleep
 
-from thespian.system.ratelimit import RateThrottle
+from thespian.system.ratelimit import RateThrottle, TokenBucketThrottle, LINK_SAMPLE_PERIOD
 from thespian.system.timing import timePeriodSeconds
 
 
@@ -60,6 +60,56 @@ class TestUnitRateLimit(object):
         assert 10 > actRate
 
 
+class TestUnitTokenBucket(object):
+
+    def testUnconfiguredIsUnlimited(self):
+        tb = TokenBucketThrottle()
+        assert tb.maximumRate is None
+        assert 0 == sum(tb.eventDelay(1.0) for _ in range(10000))
+
+    def testZeroRateIsUnlimited(self):
+        tb = TokenBucketThrottle(0)
+        assert tb.maximumRate is None
+        assert 0 == sum(tb.eventDelay(1.0) for _ in range(10000))
+
+    def testBurstThenDelay(self):
+        tb = TokenBucketThrottle(10)
+        assert [0] * 10 == [tb.eventDelay(5.0) for _ in range(10)]
+        delay = tb.eventDelay(5.0)
+        assert 0.099 < delay <= 0.1
+        # Delay requests do not consume a token
+        assert delay == tb.eventDelay(5.0)
+        assert 0 == tb.eventDelay(5.0 + delay)
+        assert 0 < tb.eventDelay(5.0 + delay)
+
+    def testRefillLimitedToBurst(self):
+        tb = TokenBucketThrottle(10, burst=2)
+        assert 0 == tb.eventDelay(1.0)
+        assert 0 == tb.eventDelay(1.0)
+        assert 0 < tb.eventDelay(1.0)
+        assert 0 == tb.eventDelay(100.0)
+        assert 0 == tb.eventDelay(100.0)
+        assert 0 < tb.eventDelay(100.0)
+
+    def testUnsaturatedLinkIsNotThrottled(self):
+        tb = TokenBucketThrottle()
+        for tick in range(100):
+            tb.observeTransmit(1000, False, 1.0 + tick * LINK_SAMPLE_PERIOD / 10)
+        assert tb.maximumRate is None
+
+    def testSaturatedLinkRateIsObserved(self):
+        tb = TokenBucketThrottle(linkUtilization=50)
+        # 100 transmits of 1000 bytes per sample period -> 100 KB/period
+        for tick in range(301):
+            tb.observeTransmit(1000, True, 1.0 + tick * LINK_SAMPLE_PERIOD / 100)
+        expected = 100 / LINK_SAMPLE_PERIOD * 0.5
+        assert abs(tb.maximumRate - expected) < expected * 0.05
+
+    def testStringDescription(self):
+        assert 'unlimited' in str(TokenBucketThrottle())
+        assert '10.0' in str(TokenBucketThrottle(10))
+
+
 if __name__ == "__main__":
     for ar in [5, 9, 0.2, 100]:
         #cnt = 10 * ar     # this way all return 10 s unless rate limited
@@ -91,6 +91,17 @@ class QueueActorAddress(object):  # internal use by this module only
 
 class ReturnTargetAddressWithEnvelope(object): pass
 
+
+class _UnpickleFailed(object): pass
+
+def _unpickle_message(msgData):
+    try:
+        return pickle.loads(msgData)
+    except Exception as ex:
+        thesplog('Unable to unpickle received message: %s', ex,
+                 level=logging.ERROR)
+        return _UnpickleFailed
+
 class ExternalQTransportCopy(object): pass
 
 
@@ -223,6 +234,7 @@ class MultiprocessQueueTCore_Common(object):
                 rcvd = 'BuMP'
             if rcvd == 'BuMP':
                 relayAddr = sendAddr = destAddr = local_routing_addr
+                msg_pickled = False
                 if self._checkChildren:
                     self._checkChildren = False
                     msg = ChildMayHaveDied()
@@ -232,7 +244,11 @@ class MultiprocessQueueTCore_Common(object):
                 else:
                     return local_routing_addr, Thespian__UpdateWork()
             else:
+                # The message itself is still pickled (see
+                # serializer()); it is only unpickled if it is
+                # delivered locally or needs to be inspected.
                 relayAddr, (sendAddr, destAddr, msg) = rcvd
+                msg_pickled = True
             if not self._queues.find(sendAddr):
                 # We don't directly know about this sender, so
                 # remember what path this arrived on to know where to
@@ -244,6 +260,10 @@ class MultiprocessQueueTCore_Common(object):
                     # none, it should be in self._queues though!
                     self._fwdvia.add(sendAddr, relayAddr)
             if hasattr(self, '_addressMgr'):
+                if msg_pickled and self._addressMgr.isDeadAddress(destAddr):
+                    # The message is needed for dead letter handling
+                    msg = _unpickle_message(msg)
+                    msg_pickled = False
                 destAddr,msg = self._addressMgr.prepMessageSend(destAddr, msg)
             if destAddr is None:
                 thesplog('Unexpected target inaccessibility for %s', msg,
@@ -255,6 +275,10 @@ class MultiprocessQueueTCore_Common(object):
                 continue
 
             if self.isMyAddress(destAddr):
+                if msg_pickled:
+                    msg = _unpickle_message(msg)
+                    if msg is _UnpickleFailed:
+                        continue
                 if isinstance(incoming_handler, ReturnTargetAddressWithEnvelope):
                     return destAddr, ReceiveEnvelope(sendAddr, msg)
                 if incoming_handler is None:
@@ -266,10 +290,15 @@ class MultiprocessQueueTCore_Common(object):
                     return destAddr, r
             else:
                 # Note: the following code has implicit knowledge of serialize() and xmit
+                if not msg_pickled:
+                    msg = pickle.dumps(msg)
+                    msg_pickled = True
                 putQValue = lambda relayer: (relayer, (sendAddr, destAddr, msg))
                 deadQValue = lambda relayer: (relayer, (sendAddr,
                                                         self._adminAddr,
-                                                        DeadEnvelope(destAddr, msg)))
+                                                        pickle.dumps(DeadEnvelope(
+                                                            destAddr,
+                                                            _unpickle_message(msg)))))
                 # Must forward this packet via a known forwarder or our parent.
                 send_dead = False
                 tgtQ = self._queues.find(destAddr)
@@ -701,18 +730,17 @@ class MultiprocessQueueTransport(asyncTransportBase, wakeupTransportBase):
         self._QCore.abort_core_run()
 
     def serializer(self, intent):
-        wrappedMsg = self._myQAddress, intent.targetAddr, intent.message
         # For multiprocess Queues, the serialization (pickling) of the
-        # outbound message happens in a separate process.  This is
-        # unfortunate because if the message is not pickle-able, the
-        # exception is thrown (and not handled) in the other process,
-        # and this process has no indication of the issue.  The
-        # unfortunate solution is that pickling must be tried in the
-        # current process first to detect these errors (unfortunate
-        # because that means each message gets pickled twice,
-        # impacting performance).
-        discard = pickle.dumps(wrappedMsg)
-        return wrappedMsg
+        # queued object happens in a separate (feeder) thread, so
+        # if the message is not pickle-able the exception is thrown
+        # (and not handled) there and this actor has no indication of
+        # the issue.  The message is therefore pickled here, and the
+        # pickled bytes are what is put on the Queue; re-pickling
+        # bytes in the feeder thread is just a copy.  The addresses
+        # are left unpickled so that actors relaying the message can
+        # route it without unpickling the message itself; only the
+        # final recipient unpickles the message.
+        return self._myQAddress, intent.targetAddr, pickle.dumps(intent.message)
 
 
     def interrupt_wait(self, signal_shutdown=False, check_children=False):
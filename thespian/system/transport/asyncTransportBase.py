@@ -9,10 +9,11 @@ from thespian.system.utilis import thesplog, partition, getenvdef
 from thespian.system.timing import ExpirationTimer
 import logging
 from thespian.system.addressManager import CannotPickleAddress
+from thespian.system.transport.spillover import TransmitSpillover
 from collections import deque
+from itertools import chain
 import threading
 from contextlib import contextmanager
-import time
 
 
 if hasattr(threading, 'main_thread'):
@@ -32,20 +33,33 @@ else:
 # before new work is accepted) until the transmit queue depth drops
 # back below QUEUE_TRANSMIT_UNBLOCK_THRESHOLD.  If the number of
 # queued transmits exceeds the DROP_TRANSMITS_LEVEL then additional
-# transmits are immediately failed instead of being queued.
+# transmits are immediately failed instead of being queued, unless
+# spillover is enabled (by setting SPILL_TRANSMITS_DIR to the
+# directory where spillover files should be written) in which case
+# the serialized transmits are written to disk and replayed in order
+# as the queue drains below QUEUE_TRANSMIT_UNBLOCK_THRESHOLD.
 
 MAX_PENDING_TRANSMITS = getenvdef('THESPIAN_MAX_PENDING_TRANSMITS', int, 20)
 MAX_QUEUED_TRANSMITS = getenvdef('THESPIAN_MAX_QUEUED_TRANSMITS', int, 950)
 QUEUE_TRANSMIT_UNBLOCK_THRESHOLD = getenvdef('THESPIAN_QUEUED_TRANSMIT_UNBLOCK_THRESHOLD', int, 780)
 DROP_TRANSMITS_LEVEL = getenvdef('THESPIAN_DROP_TRANSMITS_LEVEL', int, MAX_QUEUED_TRANSMITS + 100)
+SPILL_TRANSMITS_DIR = getenvdef('THESPIAN_SPILL_TRANSMITS_DIR', str, None)
+
+
+# Threads that are waiting for the exclusive processing flag or for a
+# transmit slot block on the transport's handoff condition, which is
+# notified whenever either is released.  The wait is bounded by
+# HANDOFF_WAIT_PERIOD as a safety net; this is not a polling period.
+HANDOFF_WAIT_PERIOD = 0.1
 
 
 @contextmanager
 def exclusive_processing(transport):
-    while not transport._exclusively_processing():
-        time.sleep(0.000001)
-    yield
-    transport._not_processing()
+    transport._await_exclusive_processing()
+    try:
+        yield
+    finally:
+        transport._not_processing()
 
 
 class asyncTransportBase(object):
@@ -73,10 +87,13 @@ class asyncTransportBase(object):
     def __init__(self, *args, **kw):
         super(asyncTransportBase, self).__init__(*args, **kw)
         self._aTB_numPendingTransmits = 0  # counts recursion and in-progress
+        self._aTB_handoff = threading.Condition(threading.Lock())
         self._aTB_lock = threading.Lock()  # protects the following:
         self._aTB_processing = False       # limits to a single operation
         self._aTB_sending = False          # transmit is being performed
         self._aTB_queuedPendingTransmits = deque()
+        self._aTB_spillover = None
+        self._aTB_spill_dir = SPILL_TRANSMITS_DIR
         self._aTB_rx_pause_enabled = True
         self._aTB_interrupted = False
 
@@ -89,6 +106,17 @@ class asyncTransportBase(object):
         self._aTB_rx_pause_enabled = enable
 
 
+    def enableTXSpillover(self, spill_dir='', enable=True):
+        """Enables (or disables) spilling of transmits beyond the
+           DROP_TRANSMITS_LEVEL to disk instead of failing them.  The
+           spill_dir specifies the directory for the spill files; an
+           empty string uses the system temporary directory.
+           Transmits that have already been spilled are still
+           replayed if spilling is subsequently disabled.
+        """
+        self._aTB_spill_dir = spill_dir if enable else None
+
+
     def _updateStatusResponse(self, resp):
         """Called to update a Thespian_SystemStatus or Thespian_ActorStatus
            with common information
@@ -98,13 +126,23 @@ class asyncTransportBase(object):
                 resp.addPendingMessage(self.myAddress,
                                        each.targetAddr,
                                        each.message)
+            if self._aTB_spillover:
+                for each in self._aTB_spillover.intents():
+                    resp.addPendingMessage(self.myAddress,
+                                           each.targetAddr,
+                                           each.message)
 
 
     def _canSendNow(self):
         return (MAX_PENDING_TRANSMITS > self._aTB_numPendingTransmits)
 
+    def transmitsBacklogged(self):
+        "Returns True if transmits are currently waiting for a transmit slot."
+        return bool(self._aTB_queuedPendingTransmits or self._aTB_spillover)
+
     def _async_txdone(self, _TXresult, _TXIntent):
         self._aTB_numPendingTransmits -= 1
+        self._notify_handoff()
 
         # If in the context of an initiated transmit, do not process
         # timeouts or do more scheduling because that could recurse
@@ -127,29 +165,26 @@ class asyncTransportBase(object):
             v, e = self._complete_expired_intents()
         # If something is queued, submit it to the lower level for transmission
         # 1. Sync with the lower level, since this will be modifying lower-level objects
-        while True:
-            nextTransmit = None
-            with self._aTB_lock:
-                if has_exclusive_flag or not self._aTB_processing:
-                    # 2. If another process is in the sending critical
-                    # section, defer to it
-                    if self._aTB_sending:
-                        return False
-                    # Nothing to send by this point, return
-                    if not self._aTB_queuedPendingTransmits:
-                        return False
-                    self._aTB_processing = True
-                    self._aTB_sending = True
-                    nextTransmit = self._aTB_queuedPendingTransmits.popleft()
-            try:
-                if nextTransmit:
-                    self._submitTransmit(nextTransmit)
-                    return True
+        with self._aTB_lock:
+            if not has_exclusive_flag and self._aTB_processing:
                 return False
-            finally:
-                self._aTB_sending = False
-                self._aTB_processing = False
-            time.sleep(0.00001)
+            # 2. If another process is in the sending critical
+            # section, defer to it
+            if self._aTB_sending:
+                return False
+            # Nothing to send by this point, return
+            if not self._aTB_queuedPendingTransmits:
+                return False
+            self._aTB_processing = True
+            self._aTB_sending = True
+            nextTransmit = self._aTB_queuedPendingTransmits.popleft()
+            self._unspill_transmits()
+        try:
+            self._submitTransmit(nextTransmit)
+            return True
+        finally:
+            self._aTB_sending = False
+            self._not_processing()
 
 
     def scheduleTransmit(self, addressManager, transmitIntent, has_exclusive_flag=False):
@@ -215,11 +250,35 @@ class asyncTransportBase(object):
 
     def _qtx(self, transmitIntent):
         with self._aTB_lock:
-            if len(self._aTB_queuedPendingTransmits) < DROP_TRANSMITS_LEVEL:
+            # Once anything has been spilled, subsequent transmits
+            # must also be spilled to preserve transmit ordering.
+            if not self._aTB_spillover and \
+               len(self._aTB_queuedPendingTransmits) < DROP_TRANSMITS_LEVEL:
                 self._aTB_queuedPendingTransmits.append(transmitIntent)
                 return True
+            return self._spill_transmit(transmitIntent)
+
+    def _spill_transmit(self, transmitIntent):
+        # n.b. called with the _aTB_lock held
+        if self._aTB_spill_dir is None:
+            return False
+        if self._aTB_spillover is None:
+            self._aTB_spillover = TransmitSpillover(self._aTB_spill_dir)
+        if self._aTB_spillover.spill(transmitIntent):
+            return True
+        thesplog('Unable to spill TX %s', transmitIntent.identify(),
+                 level=logging.WARNING)
         return False
 
+    def _unspill_transmits(self):
+        # n.b. called with the _aTB_lock held
+        if not self._aTB_spillover:
+            return
+        while self._aTB_spillover and \
+              len(self._aTB_queuedPendingTransmits) < QUEUE_TRANSMIT_UNBLOCK_THRESHOLD:
+            self._aTB_queuedPendingTransmits.append(
+                self._aTB_spillover.unspill())
+
     def _queue_tx(self, transmitIntent):
         if self._qtx(transmitIntent):
             return True
@@ -233,7 +292,10 @@ class asyncTransportBase(object):
                                            self._aTB_queuedPendingTransmits,
                                            deque)
             self._aTB_queuedPendingTransmits = validTX
-            rlen = len(validTX)
+            if self._aTB_spillover:
+                expiredTX.extend(self._aTB_spillover.expired())
+                self._unspill_transmits()
+            rlen = len(self._aTB_queuedPendingTransmits)
         for each in expiredTX:
             thesplog('TX intent %s timed out', each, level=logging.WARNING)
             each.tx_done(SendStatus.Failed)
@@ -279,6 +341,30 @@ class asyncTransportBase(object):
     def _not_processing(self):
         "Exit from critical section"
         self._aTB_processing = False
+        self._notify_handoff()
+
+    def _notify_handoff(self):
+        "Wakes any threads waiting for the processing flag or a transmit slot"
+        with self._aTB_handoff:
+            self._aTB_handoff.notify_all()
+
+    def _await_exclusive_processing(self):
+        "Blocks until this thread exclusively holds the processing mutex"
+        if self._exclusively_processing():
+            return
+        with self._aTB_handoff:
+            while not self._exclusively_processing():
+                self._aTB_handoff.wait(HANDOFF_WAIT_PERIOD)
+
+    def _await_transmit_slot(self, max_wait):
+        """Blocks until a pending transmit slot is available, or until
+           max_wait seconds have elapsed.
+        """
+        if self._canSendNow():
+            return
+        with self._aTB_handoff:
+            if not self._canSendNow():
+                self._aTB_handoff.wait(max_wait)
 
     def _schedulePreparedIntent(self, transmitIntent, has_exclusive_flag=False):
         # If there's nothing to send, that's implicit success
@@ -310,7 +396,9 @@ class asyncTransportBase(object):
                 finally:
                     self._aTB_sending = False
             else:
-                time.sleep(0.1)  # slow down threads not performing draining
+                # slow down threads not performing draining until the
+                # drainer makes room
+                self._await_transmit_slot(HANDOFF_WAIT_PERIOD)
 
         while self._canSendNow():
             if not self._runQueued(has_exclusive_flag=has_exclusive_flag):
@@ -336,7 +424,9 @@ class asyncTransportBase(object):
         # Go through pending transmits and update any to this child to
         # a dead letter delivery
         with self._aTB_lock:
-            for each in self._aTB_queuedPendingTransmits:
+            for each in chain(self._aTB_queuedPendingTransmits,
+                              self._aTB_spillover.intents()
+                              if self._aTB_spillover else []):
                 if each.targetAddr == childAddr:
                     newtgt, newmsg = addressManager.prepMessageSend(
                         each.targetAddr, each.message)
@@ -0,0 +1,160 @@
+"""Provides disk-backed spillover storage for transmits that would
+otherwise be dropped by the asyncTransportBase because the transmit
+queue has reached the THESPIAN_DROP_TRANSMITS_LEVEL.
+
+Only the serialized form of the message (the TransmitIntent .serMsg,
+which must be bytes) is moved out of memory: the TransmitIntent
+itself is retained because the callbacks and the original message
+are needed to complete the intent.  The serialized data is appended
+to memory-mapped segment files which are released as soon as all of
+the transmits they hold have been replayed (or have expired).
+Spilled transmits are replayed strictly in the order they were
+spilled.
+"""
+
+import os
+import mmap
+import tempfile
+from collections import deque
+from thespian.system.utilis import partition, getenvdef
+
+
+SPILL_SEGMENT_SIZE = getenvdef('THESPIAN_SPILL_SEGMENT_SIZE', int, 16 * 1024 * 1024)
+
+
+class _SpillSegment(object):
+    "A single memory-mapped file holding spilled serialized transmits."
+
+    def __init__(self, spill_dir, size):
+        fd, self._path = tempfile.mkstemp(prefix='thespian_tx_',
+                                          suffix='.spill',
+                                          dir=spill_dir)
+        self._file = os.fdopen(fd, 'w+b')
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        try:
+            # Remove the directory entry now so that the space is
+            # reclaimed even if this process exits without closing
+            # the segment.  Not all platforms allow removing open
+            # files, in which case this is deferred to close().
+            os.unlink(self._path)
+            self._path = None
+        except OSError:
+            pass
+        self.size = size
+        self.used = 0
+        self.live = 0
+
+    def available(self):
+        return self.size - self.used
+
+    def append(self, data):
+        offset = self.used
+        self._map[offset:offset + len(data)] = data
+        self.used += len(data)
+        self.live += 1
+        return offset
+
+    def read(self, offset, length):
+        return self._map[offset:offset + length]
+
+    def release(self):
+        "Returns True when there are no more live entries in this segment."
+        self.live -= 1
+        return self.live <= 0
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+        if self._path:
+            try:
+                os.unlink(self._path)
+            except OSError:
+                pass
+
+
+class TransmitSpillover(object):
+    """Ordered, disk-backed holding area for TransmitIntents whose
+       serialized form has been written out to memory-mapped segment
+       files.
+
+       The spill_dir specifies where the segment files are created
+       (defaulting to the system temporary directory), and each
+       segment file is segment_size bytes (or larger if needed to
+       hold a single large message).
+    """
+
+    def __init__(self, spill_dir=None, segment_size=SPILL_SEGMENT_SIZE):
+        self._spill_dir = spill_dir or None
+        self._segment_size = segment_size
+        self._segments = []
+        self._spilled = deque()  # (intent, segment, offset, length)
+
+    def __len__(self):
+        return len(self._spilled)
+
+    def __str__(self):
+        return 'TransmitSpillover(%d intents in %d segments)' % (
+            len(self._spilled), len(self._segments))
+
+    def intents(self):
+        return [S[0] for S in self._spilled]
+
+    def spill(self, intent):
+        """Moves the serialized message for this intent out to a segment
+           file and retains the intent for later replay.  Returns
+           False if the intent cannot be spilled (the serialized
+           message is not bytes) or if the segment could not be
+           written (e.g. the filesystem is full).
+        """
+        data = intent.serMsg
+        if not isinstance(data, bytes) or not data:
+            return False
+        try:
+            seg = self._segments[-1] if self._segments else None
+            if seg is None or seg.available() < len(data):
+                seg = _SpillSegment(self._spill_dir,
+                                    max(self._segment_size, len(data)))
+                self._segments.append(seg)
+            offset = seg.append(data)
+        except (OSError, IOError, ValueError):
+            return False
+        intent.serMsg = None
+        self._spilled.append((intent, seg, offset, len(data)))
+        return True
+
+    def unspill(self):
+        """Returns the oldest spilled intent with its serialized message
+           restored, or None if there are no spilled intents.
+        """
+        if not self._spilled:
+            return None
+        intent, seg, offset, length = self._spilled.popleft()
+        intent.serMsg = seg.read(offset, length)
+        self._release(seg)
+        return intent
+
+    def expired(self):
+        """Removes and returns all spilled intents that have expired;
+           their serialized messages are discarded.
+        """
+        if not self._spilled:
+            return []
+        expired, valid = partition(lambda S: S[0].expired(),
+                                   self._spilled, deque)
+        self._spilled = valid
+        for each in expired:
+            self._release(each[1])
+        return [S[0] for S in expired]
+
+    def _release(self, seg):
+        if seg.release():
+            self._segments.remove(seg)
+            seg.close()
+
+    def close(self):
+        "Discards all spilled data; the retained intents are not completed."
+        self._spilled.clear()
+        for seg in self._segments:
+            seg.close()
+        self._segments = []
@@ -1,7 +1,9 @@
 from thespian.actors import ActorAddress
 from thespian.system.transport.asyncTransportBase import (asyncTransportBase,
-                                                          MAX_PENDING_TRANSMITS)
+                                                          MAX_PENDING_TRANSMITS,
+                                                          exclusive_processing)
 from thespian.system.transport import TransmitIntent, SendStatus
+import threading
 
 
 class FakeTransport(asyncTransportBase):
@@ -192,3 +194,22 @@ class TestUnitAsyncTransportBase(object):
         assert MAX_PENDING_TRANSMITS + numExtras == len(testTrans.intents)
         assert numExtras == len([I for I in testTrans.intents
                                  if I.message in self.extraTransmitIds])
+
+
+    def test_exclusiveProcessingBlocksUntilReleased(self):
+        testTrans = FakeTransport()
+        entered = threading.Event()
+        results = []
+        def contender():
+            with exclusive_processing(testTrans):
+                entered.set()
+                results.append('contender')
+        with exclusive_processing(testTrans):
+            thrd = threading.Thread(target=contender)
+            thrd.start()
+            assert not entered.wait(0.2)
+            results.append('holder')
+        assert entered.wait(5)
+        thrd.join()
+        assert ['holder', 'contender'] == results
+        assert not testTrans._aTB_processing
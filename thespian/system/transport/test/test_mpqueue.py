@@ -0,0 +1,33 @@
+from thespian.actors import ActorAddress
+from thespian.system.transport import TransmitIntent
+from thespian.system.transport.MultiprocessQueueTransport import (
+    MultiprocessQueueTransport, MpQTEndpoint, QueueActorAddress)
+from multiprocessing import Queue
+import pickle
+import pytest
+import threading
+
+
+def _transport(name='me'):
+    addr = ActorAddress(QueueActorAddress(name))
+    return MultiprocessQueueTransport(MpQTEndpoint(None, addr, Queue(), None,
+                                                   None, addr, None))
+
+
+class TestUnitMultiprocessQueueSerializer(object):
+
+    def test_message_is_pickled_once_with_plain_addresses(self):
+        tport = _transport()
+        tgt = ActorAddress(QueueActorAddress('you'))
+        sender, target, msgData = tport.serializer(
+            TransmitIntent(tgt, ['hello', 1]))
+        assert sender == tport.myAddress
+        assert target == tgt
+        assert isinstance(msgData, bytes)
+        assert ['hello', 1] == pickle.loads(msgData)
+
+    def test_unpickleable_message_detected_in_sender(self):
+        tport = _transport()
+        with pytest.raises(Exception):
+            tport.serializer(TransmitIntent(tport.myAddress,
+                                            threading.Lock()))
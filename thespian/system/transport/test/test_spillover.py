@@ -0,0 +1,132 @@
+from datetime import timedelta
+import time
+from thespian.actors import ActorAddress
+from thespian.system.transport.spillover import TransmitSpillover
+from thespian.system.transport.asyncTransportBase import (asyncTransportBase,
+                                                          MAX_PENDING_TRANSMITS,
+                                                          DROP_TRANSMITS_LEVEL)
+from thespian.system.transport import TransmitIntent, SendStatus
+
+
+class BytesTransport(asyncTransportBase):
+
+    def __init__(self):
+        super(BytesTransport, self).__init__()
+        self.enableRXPauseFlowControl(False)
+        self.intents = []
+
+    def _scheduleTransmitActual(self, intent, has_exclusive_flag=False):
+        self.intents.append(intent)
+
+    def serializer(self, intent):
+        return ('msg-%s' % intent.message).encode('utf-8')
+
+    def interrupt_wait(self, *args, **kw): pass
+
+    def forTestingCompleteAPendingIntent(self, result):
+        for I in self.intents:
+            if I.result is None:
+                I.tx_done(result)
+                return
+
+
+def _intent(num, period=None):
+    intent = TransmitIntent(ActorAddress(num), num, maxPeriod=period)
+    intent.serMsg = ('msg-%d' % num).encode('utf-8')
+    return intent
+
+
+class TestUnitTransmitSpillover(object):
+
+    def test_empty_spillover_is_falsy(self):
+        spill = TransmitSpillover()
+        assert not spill
+        assert 0 == len(spill)
+        assert spill.unspill() is None
+
+    def test_spill_and_unspill_preserves_order_and_data(self, tmpdir):
+        spill = TransmitSpillover(str(tmpdir), segment_size=64)
+        for num in range(20):
+            assert spill.spill(_intent(num))
+        assert 20 == len(spill)
+        for num in range(20):
+            intent = spill.unspill()
+            assert num == intent.message
+            assert ('msg-%d' % num).encode('utf-8') == intent.serMsg
+        assert not spill
+        spill.close()
+
+    def test_spilled_data_is_not_retained_on_intent(self):
+        spill = TransmitSpillover()
+        intent = _intent(1)
+        assert spill.spill(intent)
+        assert intent.serMsg is None
+        assert b'msg-1' == spill.unspill().serMsg
+
+    def test_message_larger_than_segment(self):
+        spill = TransmitSpillover(segment_size=8)
+        intent = _intent(1)
+        intent.serMsg = b'x' * 1000
+        assert spill.spill(intent)
+        assert b'x' * 1000 == spill.unspill().serMsg
+
+    def test_non_bytes_cannot_be_spilled(self):
+        spill = TransmitSpillover()
+        intent = _intent(1)
+        intent.serMsg = ('me', 'you', 'msg')
+        assert not spill.spill(intent)
+        assert not spill
+
+    def test_segments_released_when_drained(self):
+        spill = TransmitSpillover(segment_size=16)
+        for num in range(10):
+            spill.spill(_intent(num))
+        assert 1 < len(spill._segments)
+        while spill:
+            spill.unspill()
+        assert [] == spill._segments
+
+    def test_expired_intents_are_removed(self):
+        spill = TransmitSpillover()
+        spill.spill(_intent(1, timedelta(milliseconds=1)))
+        spill.spill(_intent(2))
+        time.sleep(0.01)
+        expired = spill.expired()
+        assert [1] == [I.message for I in expired]
+        assert 1 == len(spill)
+        assert 2 == spill.unspill().message
+
+
+class TestUnitAsyncTransportSpillover(object):
+
+    def _fill(self, testTrans, count):
+        results = []
+        for num in range(count):
+            testTrans.scheduleTransmit(
+                None,
+                TransmitIntent(ActorAddress(num), num,
+                               lambda r, i: results.append((i.message, r)),
+                               lambda r, i: results.append((i.message, r))))
+        return results
+
+    def test_overflow_fails_without_spillover(self):
+        testTrans = BytesTransport()
+        extra = 5
+        results = self._fill(testTrans,
+                             MAX_PENDING_TRANSMITS + DROP_TRANSMITS_LEVEL + extra)
+        assert extra == len([R for R in results if R[1] == SendStatus.Failed])
+
+    def test_overflow_spills_and_replays_in_order(self, tmpdir):
+        testTrans = BytesTransport()
+        testTrans.enableTXSpillover(str(tmpdir))
+        extra = 5
+        total = MAX_PENDING_TRANSMITS + DROP_TRANSMITS_LEVEL + extra
+        results = self._fill(testTrans, total)
+        assert [] == results
+        assert extra == len(testTrans._aTB_spillover)
+        while len(testTrans.intents) < total:
+            testTrans.forTestingCompleteAPendingIntent(SendStatus.Sent)
+        assert list(range(total)) == [I.message for I in testTrans.intents]
+        assert [('msg-%d' % N).encode('utf-8') for N in range(total)] == \
+            [bytes(I.serMsg) for I in testTrans.intents]
+        assert not testTrans._aTB_spillover
@@ -8,6 +8,15 @@ from thespian.system.transport import *
 import threading
 
 
+class _TimerCallback(object):
+    """Wakeup payload for internal timers: when it expires the callback
+       is invoked from the transport's run loop instead of delivering
+       a WakeupMessage.
+    """
+    def __init__(self, callback):
+        self.callback = callback
+
+
 class wakeupTransportBase(object):
 
     """The wakeupTransportBase is designed to be used as a mixin-base for
@@ -50,7 +59,8 @@ class wakeupTransportBase(object):
         # we only pass the ExpirationTimer without payload as this should be
         # sufficient for status information.
         with self._wakeup_lock:
-            resp.addWakeups([(self.myAddress, T[0]) for T in self._pendingWakeups])
+            resp.addWakeups([(self.myAddress, T[0]) for T in self._pendingWakeups
+                             if not isinstance(T[1], _TimerCallback)])
             for each in self._activeWakeups:
                 resp.addPendingMessage(self.myAddress, self.myAddress, str(each.message))
 
@@ -106,14 +116,30 @@ class wakeupTransportBase(object):
         if newTimer < self.run_time:
             self.run_time = newTimer
 
+    def addTimerCallback(self, timePeriod, callback):
+        """Schedules an internal callback (with no arguments) to be invoked
+           from the transport's run loop after the timePeriod has
+           elapsed.  Unlike addWakeup, nothing is delivered to the
+           incoming handler.
+        """
+        self.addWakeup(timePeriod, _TimerCallback(callback))
+
     def _realizeWakeups(self):
         "Find any expired wakeups and queue them to the send processing queue"
+        callbacks = []
         with self._wakeup_lock:
             ct = currentTime()
             starting_len = len(self._activeWakeups)
             while self._pendingWakeups and self._pendingWakeups[0][0].view(ct).expired():
                 timer, payload = self._pendingWakeups.pop(0)
+                if isinstance(payload, _TimerCallback):
+                    callbacks.append(payload.callback)
+                    continue
                 self._activeWakeups.append(
                     ReceiveEnvelope(self.myAddress,
                                     WakeupMessage(timer.duration, payload)))
+        # Callbacks are run without holding the lock because they
+        # may schedule additional wakeups.
+        for each in callbacks:
+            each()
         return starting_len != len(self._activeWakeups)
@@ -0,0 +1,54 @@
+"""Verify that rate throttled sends are deferred rather than blocking
+the sending Actor.
+
+The maximum send rate for an Actor can be specified via the 'Thespian
+Rate Throttle' key in the targetActorRequirements (or the ActorSystem
+capabilities).  Sends in excess of that rate are queued and delivered
+later, but the Actor continues to handle incoming messages in the
+meantime.
+"""
+
+from thespian.test import *
+import time
+from thespian.actors import *
+
+
+class Collector(Actor):
+    def __init__(self):
+        self.received = []
+    def receiveMessage(self, msg, sender):
+        if msg == 'received?':
+            self.send(sender, list(self.received))
+        elif isinstance(msg, int):
+            self.received.append(msg)
+
+
+class Burster(Actor):
+    def receiveMessage(self, msg, sender):
+        if isinstance(msg, tuple):
+            target, count = msg
+            for num in range(count):
+                self.send(target, num)
+        elif msg == 'ping':
+            self.send(sender, 'sent')
+
+
+class TestFuncRateThrottle(object):
+
+    def test_throttled_sends_are_deferred_in_order(self, asys):
+        actor_system_unsupported(asys, 'simpleSystemBase')
+        collector = asys.createActor(Collector)
+        burster = asys.createActor(Burster,
+                                   targetActorRequirements={
+                                       'Thespian Rate Throttle': 10})
+        start = time.time()
+        # The burst allowance is one second's worth of sends, so the
+        # remainder must be deferred.
+        asys.tell(burster, (collector, 25))
+        time.sleep(0.5)
+        assert len(asys.ask(collector, 'received?', 5)) < 25
+        # Deferred sends are still delivered in order
+        assert 'sent' == asys.ask(burster, 'ping', 5)
+        received = asys.ask(collector, 'received?', 5)
+        assert list(range(25)) == received
+        assert time.time() - start > 1.0